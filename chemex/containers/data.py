@@ -1,7 +1,6 @@
-from copy import deepcopy
+from copy import copy, deepcopy
 from dataclasses import dataclass, field
 from functools import cached_property
-from random import choices
 from typing import Any, Self
 
 import numpy as np
@@ -12,6 +11,20 @@ from chemex.typing import ArrayBool, ArrayFloat
 rng = np.random.default_rng()
 
 
+def seed_rngs(seed: int | np.random.SeedSequence | None = None) -> None:
+    """Seed the random number generator used for resampling.
+
+    Reseeds the module-level generator, so that Monte-Carlo and bootstrap
+    datasets are reproducible and, when run in parallel workers,
+    statistically independent.
+
+    Args:
+        seed: Seed or NumPy SeedSequence used to initialize the generator.
+    """
+    global rng  # noqa: PLW0603
+    rng = np.random.default_rng(seed)
+
+
 @dataclass
 class Data:
     """Dataset with experimental, calculated data and metadata.
@@ -78,7 +91,9 @@ class Data:
         Returns:
             Self: New Data instance for Monte-Carlo simulation.
         """
-        data = deepcopy(self)
+        # A shallow copy is enough: the noisy draw rebinds 'exp' to a new array
+        # and the other arrays are never modified in place afterwards
+        data = copy(self)
         data.exp = rng.normal(self.calc, self.err)
         return data
 
@@ -91,10 +106,17 @@ class Data:
         indexes = np.arange(self.metadata.size)
         pool1 = indexes[self.refs & self.mask]
         pool2 = indexes[~self.refs & self.mask]
-        bs_indexes: list[int] = sorted(
-            [*choices(pool1, k=pool1.size), *choices(pool2, k=pool2.size)],
+        bs_indexes = np.sort(
+            np.concatenate(
+                (rng.choice(pool1, pool1.size), rng.choice(pool2, pool2.size)),
+            ),
         )
-        data = deepcopy(self)
+        # Only the arrays rewritten below need their own buffers; the rest of
+        # the instance can be shared
+        data = copy(self)
+        data.metadata = self.metadata.copy()
+        data.exp = self.exp.copy()
+        data.err = self.err.copy()
         data.metadata[self.mask] = self.metadata[bs_indexes]
         data.exp[self.mask] = self.exp[bs_indexes]
         data.err[self.mask] = self.err[bs_indexes]
@@ -102,6 +124,12 @@ class Data:
 
     def sort(self) -> None:
         """Sort the data based on metadata values."""
+        if self.metadata.dtype.names is None and np.all(
+            self.metadata[:-1] <= self.metadata[1:],
+        ):
+            # Already sorted: skip re-indexing all the arrays. Plot helpers
+            # sort the same data repeatedly, so this is the common case.
+            return
         sorted_indexes = self.metadata.argsort()
         self.metadata = self.metadata[sorted_indexes]
         self.exp = self.exp[sorted_indexes]
@@ -116,7 +144,8 @@ class Data:
         Returns:
             bool: True if duplicates exist, False otherwise.
         """
-        return np.unique(self.metadata).size != self.metadata.size
+        metadata_sorted = np.sort(self.metadata)
+        return bool(np.any(metadata_sorted[1:] == metadata_sorted[:-1]))
 
     def __add__(self, other: Self) -> Self:
         """Add two Data instances, combining their experimental data and errors.
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import Any
 
 import numpy as np
+from numpy.typing import NDArray
 
 from chemex.configuration.base import ExperimentConfiguration
 from chemex.configuration.data import RelaxationDataSettings, ShiftDataSettings
@@ -19,26 +22,52 @@ RelaxationConfig = ExperimentConfiguration[Any, Any, RelaxationDataSettings]
 ShiftConfig = ExperimentConfiguration[Any, Any, ShiftDataSettings]
 
 
+def _read_profile_files(
+    settings: RelaxationConfig,
+    data_path: Path,
+    dtype: list[tuple[str, str]],
+    usecols: list[int] | None = None,
+) -> list[tuple[SpinSystem, NDArray[Any]]]:
+    """Read all profile files of an experiment concurrently.
+
+    Parsing a dataset made of many small profile files is dominated by file
+    IO, so the files are read with a thread pool rather than one at a time.
+    """
+    spin_systems: list[SpinSystem] = []
+    filepaths: list[Path] = []
+    for spin_system, paths in settings.data.profiles.items():
+        spin_systems.extend([spin_system] * len(paths))
+        filepaths.extend(data_path / path for path in paths)
+
+    with ThreadPoolExecutor() as executor:
+        raw_data = executor.map(
+            partial(np.loadtxt, dtype=dtype, usecols=usecols),
+            filepaths,
+        )
+
+    return list(zip(spin_systems, raw_data, strict=True))
+
+
 def load_relaxation_dataset(base_path: Path, settings: RelaxationConfig) -> Dataset:
     data_path = normalize_path(base_path, settings.data.path)
     dtype = [("metadata", "f8"), ("exp", "f8"), ("err", "f8")]
 
-    dataset: Dataset = []
-    for spin_system, filepaths in settings.data.profiles.items():
-        for filepath in filepaths:
-            raw_data = np.loadtxt(data_path / filepath, dtype=dtype, usecols=[0, 1, 2])
-            dataset.append(
-                (
-                    spin_system,
-                    Data(
-                        exp=raw_data["exp"],
-                        err=raw_data["err"],
-                        metadata=raw_data["metadata"],
-                    ),
-                ),
-            )
-
-    return dataset
+    return [
+        (
+            spin_system,
+            Data(
+                exp=raw_data["exp"],
+                err=raw_data["err"],
+                metadata=raw_data["metadata"],
+            ),
+        )
+        for spin_system, raw_data in _read_profile_files(
+            settings,
+            data_path,
+            dtype,
+            usecols=[0, 1, 2],
+        )
+    ]
 
 
 def load_exsy_dataset(base_path: Path, settings: RelaxationConfig) -> Dataset:
@@ -51,22 +80,17 @@ def load_exsy_dataset(base_path: Path, settings: RelaxationConfig) -> Dataset:
         ("err", "f8"),
     ]
 
-    dataset: Dataset = []
-    for spin_system, filepaths in settings.data.profiles.items():
-        for filepath in filepaths:
-            raw_data = np.loadtxt(data_path / filepath, dtype=dtype)
-            dataset.append(
-                (
-                    spin_system,
-                    Data(
-                        exp=raw_data["exp"],
-                        err=raw_data["err"],
-                        metadata=raw_data[["times", "states1", "states2"]],
-                    ),
-                ),
-            )
-
-    return dataset
+    return [
+        (
+            spin_system,
+            Data(
+                exp=raw_data["exp"],
+                err=raw_data["err"],
+                metadata=raw_data[["times", "states1", "states2"]],
+            ),
+        )
+        for spin_system, raw_data in _read_profile_files(settings, data_path, dtype)
+    ]
 
 
 def load_shift_dataset(base_path: Path, settings: ShiftConfig) -> Dataset:
@@ -9,13 +9,13 @@ from __future__ import annotations
 from collections.abc import Iterator
 from itertools import chain
 from pathlib import Path
-from random import choices
 from typing import Literal, Self
 
 import numpy as np
 from lmfit.parameter import Parameters
 
 from chemex.configuration.methods import Selection
+from chemex.containers import data
 from chemex.containers.experiment import Experiment
 from chemex.messages import print_selecting_profiles
 from chemex.parameters import database
@@ -231,8 +231,11 @@ def generate_bootstrap_ns_experiments(experiments: Experiments) -> Experiments:
     Returns:
         Experiments: Collection with Bootstrap NS simulated data.
     """
-    groups = experiments.groups
-    groups_bs = choices(tuple(groups), k=len(groups))
+    # Draw from the same generator as the profile-level resampling methods, so
+    # that one seed controls all the statistics simulations
+    groups_all = tuple(experiments.groups)
+    picks = data.rng.integers(len(groups_all), size=len(groups_all))
+    groups_bs = [groups_all[pick] for pick in picks]
     experiments_bs = Experiments()
     for experiment in experiments:
         experiments_bs.add(experiment.bootstrap_ns(groups_bs))
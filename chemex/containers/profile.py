@@ -2,10 +2,10 @@ from __future__ import annotations
 
 from collections.abc import Hashable
 from copy import deepcopy
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from functools import cached_property
 from operator import attrgetter
-from typing import Protocol, Self
+from typing import Any, Protocol, Self
 
 from cachetools import LRUCache, cachedmethod
 from lmfit import Parameters as ParametersLF
@@ -50,11 +50,25 @@ class Profile:
     is_scaled: bool = field(compare=False, default=True)
     spin_system: SpinSystem = field(compare=True, init=False)
     cache: LRUCache = field(compare=False, init=False)
+    _metadata_token: tuple[Any, bytes] = field(compare=False, init=False)
+    _param_id_tuple: tuple[str, ...] = field(compare=False, init=False)
+    _name_map_items: tuple[tuple[str, str], ...] = field(compare=False, init=False)
+
+    def _get_metadata_token(self) -> bytes:
+        """Get the bytes token of the metadata used in cache keys.
+
+        The token is recomputed only when 'data.metadata' is rebound to a new
+        array, saving an O(n) copy on every residuals evaluation.
+        """
+        metadata = self.data.metadata
+        if self._metadata_token[0] is not metadata:
+            self._metadata_token = (metadata, metadata.tobytes())
+        return self._metadata_token[1]
 
     def _cache_key(self, params: ParametersLF) -> tuple[Hashable, ...]:
         return (
-            *(params[param_id].value for param_id in self.param_ids),
-            self.data.metadata.tobytes(),
+            *(params[param_id].value for param_id in self._param_id_tuple),
+            self._get_metadata_token(),
         )
 
     def __post_init__(self) -> None:
@@ -62,6 +76,9 @@ class Profile:
         self.spin_system = self.spectrometer.liouvillian.spin_system
         self.data.refs = self.pulse_sequence.is_reference(self.data.metadata)
         self.cache = LRUCache(maxsize=5)
+        self._metadata_token = (None, b"")
+        self._param_id_tuple = tuple(sorted(self.param_ids))
+        self._name_map_items = tuple(self.name_map.items())
 
     @cached_property
     def param_ids(self) -> set[str]:
@@ -72,7 +89,7 @@ class Profile:
         """Get the parameter values from the provided parameters."""
         return {
             local_name: params[param_id].value
-            for local_name, param_id in self.name_map.items()
+            for local_name, param_id in self._name_map_items
         }
 
     def update_spectrometer(self, params: ParametersLF) -> None:
@@ -113,16 +130,30 @@ class Profile:
         self.data.exp = self.data.calc
         self.printer.simulation = True
 
+    def _copy_for_statistics(self) -> Self:
+        """Build a copy of the profile with a residuals cache of its own.
+
+        The copy shares the spectrometer and pulse sequence with the original,
+        as those are reset from the parameters on every evaluation. It is
+        built with 'replace' rather than a shallow copy so that '__post_init__'
+        runs again and the new instance starts with an empty cache and none of
+        the cached state of the original (on first use, cachetools stores the
+        bound 'residuals' wrapper in the instance dict, and a shallow copy
+        carrying it would keep delegating to the original profile and its
+        cache).
+        """
+        return replace(self)
+
     def monte_carlo(self: Self) -> Self:
         """Generate a Monte Carlo variant of the profile."""
-        profile = deepcopy(self)
-        profile.data = profile.data.monte_carlo()
+        profile = self._copy_for_statistics()
+        profile.data = self.data.monte_carlo()
         return profile
 
     def bootstrap(self) -> Self:
         """Generate a bootstrap variant of the profile."""
-        profile = deepcopy(self)
-        profile.data = profile.data.bootstrap()
+        profile = self._copy_for_statistics()
+        profile.data = self.data.bootstrap()
         return profile
 
     def any_duplicate(self) -> bool:
@@ -103,23 +103,25 @@ class Cest15NCwSequence:
 
         start = spectrometer.get_start_magnetization(terms=["iz"], atom="n")
 
-        intensities: dict[float, ArrayFloat] = {}
+        intensities: dict[float, ArrayFloat] = dict.fromkeys(set(offsets), start)
 
-        for offset in set(offsets):
-            intensities[offset] = start
-
-            if self.is_reference(offset):
-                continue
-
-            spectrometer.offset_i = offset
+        offsets_cest = np.array(
+            [offset for offset in intensities if not self.is_reference(offset)],
+        )
 
-            intensities[offset] = (
-                spectrometer.pulse_is(self.settings.time_t1, 0.0, 0.0)
-                @ intensities[offset]
+        if offsets_cest.size:
+            pulses = spectrometer.pulse_is_offsets(
+                self.settings.time_t1, 0.0, 0.0, offsets_cest
             )
-
-        return np.array(
-            [spectrometer.detect(intensities[offset]) for offset in offsets],
+            for offset, pulse in zip(offsets_cest, pulses, strict=True):
+                intensities[offset] = pulse @ start
+
+        # Reference points keep the un-pulsed start magnetization, so broadcast
+        # all the vectors to a common shape before stacking
+        return spectrometer.detect_stack(
+            np.stack(
+                np.broadcast_arrays(*(intensities[offset] for offset in offsets)),
+            ),
         )
 
 
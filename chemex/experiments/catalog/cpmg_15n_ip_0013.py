@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from functools import reduce
 from typing import Literal
 
 import numpy as np
@@ -16,7 +15,7 @@ from chemex.experiments.factories import Creators, factories
 from chemex.filterers import PlanesFilterer
 from chemex.nmr.basis import Basis
 from chemex.nmr.liouvillian import LiouvillianIS
-from chemex.nmr.spectrometer import Spectrometer
+from chemex.nmr.spectrometer import Spectrometer, multiply_propagators
 from chemex.parameters.spin_system import SpinSystem
 from chemex.plotters.cpmg import CpmgPlotter
 from chemex.printers.data import CpmgPrinter
@@ -150,7 +149,7 @@ class Cpmg15N0013IpSequence:
         for ncyc in set(ncycs) - {0.0}:
             phases = self._get_phases(ncyc)
             echo = d_cp[ncyc] @ p180 @ d_cp[ncyc]
-            cpmg = reduce(np.matmul, echo[phases.T])
+            cpmg = multiply_propagators(echo[phases.T])
             intensities[ncyc] = spectrometer.detect(
                 d_delta[ncyc] @ p90[3] @ d_neg @ cpmg @ d_neg @ p90[1] @ start,
             )
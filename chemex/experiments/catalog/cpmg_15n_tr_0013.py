@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from functools import reduce
 from typing import Literal
 
 import numpy as np
@@ -16,7 +15,7 @@ from chemex.experiments.factories import Creators, factories
 from chemex.filterers import PlanesFilterer
 from chemex.nmr.basis import Basis
 from chemex.nmr.liouvillian import LiouvillianIS
-from chemex.nmr.spectrometer import Spectrometer
+from chemex.nmr.spectrometer import Spectrometer, multiply_propagators
 from chemex.parameters.spin_system import SpinSystem
 from chemex.plotters.cpmg import CpmgPlotter
 from chemex.printers.data import CpmgPrinter
@@ -191,8 +190,8 @@ class Cpmg15NTr0013Sequence:
         for ncyc in set(ncycs) - {0.0}:
             phases1, phases2 = self._get_phases(ncyc)
             echo = d_cp[ncyc] @ p180 @ d_cp[ncyc]
-            cpmg1 = d_neg @ reduce(np.matmul, echo[phases1.T]) @ d_neg
-            cpmg2 = d_neg @ reduce(np.matmul, echo[phases2.T]) @ d_neg
+            cpmg1 = d_neg @ multiply_propagators(echo[phases1.T]) @ d_neg
+            cpmg2 = d_neg @ multiply_propagators(echo[phases2.T]) @ d_neg
             intst[ncyc] = spectrometer.detect(
                 d_eq
                 @ d_delta[ncyc]
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from functools import reduce
 from typing import Literal
 
 import numpy as np
@@ -17,7 +16,7 @@ from chemex.filterers import PlanesFilterer
 from chemex.nmr.basis import Basis
 from chemex.nmr.constants import GAMMA
 from chemex.nmr.liouvillian import LiouvillianIS
-from chemex.nmr.spectrometer import Spectrometer
+from chemex.nmr.spectrometer import Spectrometer, multiply_propagators
 from chemex.parameters.spin_system import SpinSystem
 from chemex.plotters.cpmg import CpmgPlotter
 from chemex.printers.data import CpmgPrinter
@@ -171,8 +170,8 @@ class CpmgCh31HTqDiffSequence:
             phases1, phases2 = self._get_phases(ncyc)
             echo1 = d_cp_4[ncyc] @ p180_cp1 @ d_cp_4[ncyc]
             echo2 = d_cp_4[ncyc] @ p180_cp2 @ d_cp_4[ncyc]
-            cpmg1 = reduce(np.matmul, echo1[phases1])
-            cpmg2 = reduce(np.matmul, echo2[phases2])
+            cpmg1 = multiply_propagators(echo1[phases1])
+            cpmg2 = multiply_propagators(echo2[phases2])
             centre = grad2 @ cpmg2 @ p180pmy_4 @ cpmg1 @ grad1
             if self.settings.ipap_flg:
                 centre = 0.5 * (centre + p180_sx @ centre @ p180_sx)
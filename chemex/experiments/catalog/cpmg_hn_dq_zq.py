@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from functools import reduce
 from typing import Literal
 
 import numpy as np
@@ -18,7 +17,7 @@ from chemex.experiments.factories import Creators, factories
 from chemex.filterers import PlanesFilterer
 from chemex.nmr.basis import Basis
 from chemex.nmr.liouvillian import LiouvillianIS
-from chemex.nmr.spectrometer import Spectrometer
+from chemex.nmr.spectrometer import Spectrometer, multiply_propagators
 from chemex.parameters.spin_system import SpinSystem
 from chemex.plotters.cpmg import CpmgPlotter
 from chemex.printers.data import CpmgPrinter
@@ -86,6 +85,11 @@ def build_spectrometer(
 class CpmgHNDqZqSequence:
     settings: CpmgHNDqZqSettings
 
+    def __post_init__(self) -> None:
+        # The phase patterns depend only on ncyc, so they are built once per
+        # ncyc value rather than on every evaluation
+        self._phases_cache: dict[float, tuple[ArrayInt, ArrayInt]] = {}
+
     def _get_tau_cps(self, ncycs: ArrayFloat) -> dict[float, float]:
         ncycs_no_ref = ncycs[ncycs > 0]
         return dict(
@@ -98,6 +102,8 @@ class CpmgHNDqZqSequence:
         )
 
     def _get_phases(self, ncyc: float) -> tuple[ArrayInt, ArrayInt]:
+        if (phases := self._phases_cache.get(ncyc)) is not None:
+            return phases
         nu_cpmg = ncyc / self.settings.time_t2
         if nu_cpmg < NU_CPMG_LIMIT_1:
             cp_phases1 = [0, 1, 0, 1]
@@ -111,6 +117,7 @@ class CpmgHNDqZqSequence:
         indexes = np.arange(2 * int(ncyc))
         phases1 = np.take(cp_phases1, np.flip(indexes), mode="wrap")
         phases2 = np.take(cp_phases2, np.flip(indexes), mode="wrap")
+        self._phases_cache[ncyc] = (phases1, phases2)
         return phases1, phases2
 
     def calculate(self, spectrometer: Spectrometer, data: Data) -> ArrayFloat:
@@ -119,12 +126,24 @@ class CpmgHNDqZqSequence:
         # Calculation of the spectrometers corresponding to all the delays
         tau_cps = self._get_tau_cps(ncycs)
         ncyc_list, delay_list = zip(*tau_cps.items(), strict=True)
-        d_cp = dict(zip(ncyc_list, spectrometer.delays(delay_list), strict=True))
+        d_cp = spectrometer.delays(delay_list)
+        if len(ncyc_list) == 1:
+            # 'delays' drops the time axis when given a single delay
+            d_cp = d_cp[np.newaxis]
 
         # Calculation of the spectrometers corresponding to all the pulses
         p9024090_1 = spectrometer.p9024090_nh_1[[0, 1], [0, 1]]
         p9024090_2 = spectrometer.p9024090_nh_2[[0, 1], [0, 1]]
 
+        # Sandwiching the pulses between the CPMG delays for all ncycs at once
+        d_cp_ncycs = d_cp[:, np.newaxis]
+        echoes1 = dict(
+            zip(ncyc_list, d_cp_ncycs @ p9024090_1 @ d_cp_ncycs, strict=True),
+        )
+        echoes2 = dict(
+            zip(ncyc_list, d_cp_ncycs @ p9024090_2 @ d_cp_ncycs, strict=True),
+        )
+
         # Getting the starting magnetization
         start = spectrometer.get_start_magnetization(["2ixsx"])
 
@@ -132,10 +151,8 @@ class CpmgHNDqZqSequence:
         intensities = {0.0: spectrometer.detect(start)}
         for ncyc in set(ncycs) - {0.0}:
             phases1, phases2 = self._get_phases(ncyc)
-            echo1 = d_cp[ncyc] @ p9024090_1 @ d_cp[ncyc]
-            echo2 = d_cp[ncyc] @ p9024090_2 @ d_cp[ncyc]
-            cpmg1 = reduce(np.matmul, echo1[phases1])
-            cpmg2 = reduce(np.matmul, echo2[phases2])
+            cpmg1 = multiply_propagators(echoes1[ncyc][phases1])
+            cpmg2 = multiply_propagators(echoes2[ncyc][phases2])
             intensities[ncyc] = spectrometer.detect(0.5 * (cpmg1 + cpmg2) @ start)
 
         # Return profile
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from typing import Any, Generic, Literal, Protocol, TypeVar
 
+import numpy as np
+
 from chemex.containers.data import Data
 from chemex.nmr.spectrometer import Spectrometer
 
@@ -60,32 +62,37 @@ def _filter_ref_planes(data: Data) -> None:
     data.mask[data.refs] = False
 
 
-def _filter_offsets(
-    data: Data,
-    config: CestExperimentConfig,
-    spectrometer: Spectrometer,
-) -> None:
-    state = config.experiment.observed_state
-    state_ppm = spectrometer.par_values[f"cs_i_{state}"]
-    state_offset = spectrometer.ppms_to_offsets(state_ppm)
-
-    offsets = data.metadata
-    offset_min = min(offsets[~data.refs])
-
-    for offset_to_filter, filter_bandwidth in config.data.filter_offsets:
-        absolute_offset = offset_to_filter + state_offset
-        offset_with_aliasing = (
-            absolute_offset - offset_min
-        ) % config.experiment.sw + offset_min
-        shifted_offsets = offsets - offset_with_aliasing
-        mask_filter = abs(shifted_offsets) < filter_bandwidth * 0.5
-        data.mask[mask_filter] = False
-
-
 class CestFilterer(Generic[T]):
     def __init__(self, config: T, spectrometer: Spectrometer, **_extra: Any) -> None:
         self.config = config
         self.spectrometer = spectrometer
+        # These only depend on the configuration, so they are derived once
+        state = config.experiment.observed_state
+        self._cs_i_key = f"cs_i_{state}"
+        filter_offsets = config.data.filter_offsets or [(np.nan, np.nan)]
+        self._offsets_to_filter, self._filter_bandwidths = np.transpose(filter_offsets)
+
+    def _filter_offsets(self, data: Data) -> None:
+        if not self.config.data.filter_offsets:
+            return
+
+        state_ppm = self.spectrometer.par_values[self._cs_i_key]
+        state_offset = self.spectrometer.ppms_to_offsets(state_ppm)
+
+        offsets = data.metadata
+        offset_min = min(offsets[~data.refs])
+
+        # All the filter windows are applied in one broadcast pass
+        absolute_offsets = self._offsets_to_filter + state_offset
+        offsets_with_aliasing = (
+            absolute_offsets - offset_min
+        ) % self.config.experiment.sw + offset_min
+        shifted_offsets = offsets - offsets_with_aliasing[:, np.newaxis]
+        mask_filter = np.any(
+            np.abs(shifted_offsets) < self._filter_bandwidths[:, np.newaxis] * 0.5,
+            axis=0,
+        )
+        data.mask[mask_filter] = False
 
     def filter(self, data: Data) -> None:
         _filter_planes(data, self.config.data.filter_planes)
@@ -93,4 +100,4 @@ class CestFilterer(Generic[T]):
         if self.config.data.filter_ref_planes:
             _filter_ref_planes(data)
 
-        _filter_offsets(data, self.config, self.spectrometer)
+        self._filter_offsets(data)
@@ -242,6 +242,19 @@ class LiouvillianIS:
             start=np.array(0.0),
         )
 
+    def l_free_offsets_i(self, offsets: ArrayFloat) -> ArrayFloat:
+        """Free-precession Liouvillians for a batch of I-spin offsets.
+
+        Returns the matrices that 'l_free' would yield for each offset in turn,
+        stacked along a new leading axis. The current 'offset_i' value is left
+        unchanged.
+        """
+        values = np.asarray(offsets, dtype=np.float64).reshape((-1, 1, 1, 1, 1))
+        l_offsets_i = (
+            self.matrices.get("offset_i", np.array(0.0)) * values * np.sign(self.ppm_i)
+        )
+        return self.l_free - self._l_offset_i + l_offsets_i
+
     @property
     def weights(self) -> ArrayFloat:
         return self._b1_i_weights * self._jeff_i_weights
@@ -266,6 +279,21 @@ class LiouvillianIS:
             detected = np.sign(detected.real) * np.abs(detected)
         return float(detected)
 
+    def detect_stack(self, magnetization: ArrayFloat) -> ArrayFloat:
+        """Detect a stack of magnetization vectors in one call.
+
+        Applies the same reduction as 'detect' to every element of the extra
+        leading axis of 'magnetization', avoiding one Python-level call per
+        data point.
+        """
+        shape = magnetization.shape[0], -1, *magnetization.shape[-2:]
+        mag_weighted = self.weights * magnetization
+        mag = mag_weighted.reshape(shape).sum(axis=1)
+        detected = (self._detect_vector @ mag).ravel()
+        if np.iscomplexobj(detected):
+            detected = np.sign(detected.real) * np.abs(detected)
+        return detected.astype(np.float64)
+
     def get_equilibrium(self) -> ArrayFloat:
         mag = np.zeros((self.size, 1))
         for state, (name, atom) in product(model.states, self.basis.atoms.items()):
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 from collections.abc import Hashable, Iterable, Sequence
-from functools import reduce
 from itertools import product
 
 import numpy as np
@@ -81,6 +80,23 @@ def calculate_propagators(
     return propagators.real
 
 
+def multiply_propagators(propagators: ArrayFloat) -> ArrayFloat:
+    """Multiply a stack of propagators together along the leading axis.
+
+    Equivalent to 'reduce(np.matmul, propagators)', but pairs the matrices up
+    at each step, so the number of Python-level matmul calls grows with
+    log(N) rather than N.
+    """
+    while len(propagators) > 1:
+        if len(propagators) % 2:
+            propagators = np.concatenate(
+                (propagators[:1], propagators[1::2] @ propagators[2::2]),
+            )
+        else:
+            propagators = propagators[0::2] @ propagators[1::2]
+    return propagators[0]
+
+
 def _get_key(
     liouvillian: LiouvillianIS, *args: Hashable, **kwargs: Hashable
 ) -> tuple[Hashable, ...]:
@@ -279,6 +295,9 @@ class Spectrometer:
     def detect(self, magnetization: ArrayFloat) -> float:
         return self.liouvillian.detect(magnetization)
 
+    def detect_stack(self, magnetization: ArrayFloat) -> ArrayFloat:
+        return self.liouvillian.detect_stack(magnetization)
+
     @property
     def gradient_dephasing(self) -> float:
         return self.liouvillian.gradient_dephasing
@@ -337,6 +356,29 @@ class Spectrometer:
         )
         return calculate_propagators(liouv, times, dephasing=dephased)
 
+    def pulse_is_offsets(
+        self,
+        times: float | Iterable[float],
+        phase_i: float,
+        phase_s: float,
+        offsets: ArrayFloat,
+    ) -> ArrayFloat:
+        """Calculate the 'pulse_is' propagators for a batch of I-spin offsets.
+
+        The Liouvillians for all offsets are diagonalized in a single call,
+        which is much faster than calling 'pulse_is' once per offset. The
+        returned array has a leading axis running over 'offsets'.
+        """
+        dephased = self.b1_i_inh_scale == np.inf
+        liouv = (
+            self.liouvillian.l_free_offsets_i(offsets)
+            + np.cos(phase_i * np.pi * 0.5) * self.liouvillian.l_b1x_i
+            + np.sin(phase_i * np.pi * 0.5) * self.liouvillian.l_b1y_i
+            + np.cos(phase_s * np.pi * 0.5) * self.liouvillian.l_b1x_s
+            + np.sin(phase_s * np.pi * 0.5) * self.liouvillian.l_b1y_s
+        )
+        return calculate_propagators(liouv, times, dephasing=dephased)
+
     def shaped_pulse_i(
         self,
         pw: float,
@@ -348,7 +390,9 @@ class Spectrometer:
         pulses = {
             (amp, ph): self.pulse_i(time, ph, scale=amp) for amp, ph in set(pairs)
         }
-        base = reduce(np.matmul, (pulses[pair] for pair in reversed(pairs)))
+        base = multiply_propagators(
+            np.stack([pulses[pair] for pair in reversed(pairs)]),
+        )
         return self._add_phases(base, "i")
 
     def _calculate_base_pulses_i(self) -> None:
@@ -1,11 +1,17 @@
 """The fitting module contains the code for fitting the experimental data."""
 from __future__ import annotations
 
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Any
 
+import numpy as np
 from rich.progress import track
 
 from chemex.configuration.methods import Methods, Statistics
+from chemex.containers.data import seed_rngs
 from chemex.containers.experiments import Experiments, generate_exp_for_statistics
 from chemex.messages import (
     print_calculation_stopped_error,
@@ -33,6 +39,48 @@ from chemex.optimize.minimizer import (
 )
 from chemex.parameters import database
 
+# The workers rely on forked memory: the experiments hold unpicklable state
+# and the parameter catalog is a module-level singleton, neither of which
+# survives a spawn. Without fork (Windows), iterations run sequentially.
+try:
+    _FORK_CONTEXT = multiprocessing.get_context("fork")
+except ValueError:
+    _FORK_CONTEXT = None
+
+# State shared with the statistics worker processes, set once per pool via the
+# executor initializer to avoid pickling the experiments for every iteration
+_worker_state: dict[str, Any] = {}
+
+
+def _initialize_statistics_worker(
+    experiments: Experiments,
+    statistic_name: str,
+    fitmethod: str,
+    ids_vary: list[str],
+) -> None:
+    _worker_state["experiments"] = experiments
+    _worker_state["statistic_name"] = statistic_name
+    _worker_state["fitmethod"] = fitmethod
+    _worker_state["ids_vary"] = ids_vary
+
+
+def _run_statistics_iteration(seed: np.random.SeedSequence) -> str:
+    """Run one Monte-Carlo/bootstrap iteration and return the formatted result.
+
+    The simulated dataset is generated inside the worker from the provided seed,
+    so that each iteration draws from an independent random stream.
+    """
+    seed_rngs(seed)
+    exp_stat = generate_exp_for_statistics(
+        _worker_state["experiments"],
+        _worker_state["statistic_name"],
+    )
+    params_lf = database.build_lmfit_params(exp_stat.param_ids)
+    params_fit = minimize(exp_stat, params_lf, _worker_state["fitmethod"])
+    stats = calculate_statistics(exp_stat, params_fit)
+    chisqr = stats.get("chisqr", 1e32)
+    return print_values_stat(params_fit, _worker_state["ids_vary"], chisqr)
+
 
 def _run_statistics(
     experiments: Experiments,
@@ -52,6 +100,8 @@ def _run_statistics(
     params_lf = database.build_lmfit_params(experiments.param_ids)
     ids_vary = [param.name for param in params_lf.values() if param.vary]
 
+    max_workers = max(1, (os.cpu_count() or 2) - 1)
+
     for statistic_name, iter_nb in statistics.model_dump().items():
         if iter_nb is None:
             continue
@@ -60,17 +110,39 @@ def _run_statistics(
 
         print_running_statistics(method["message"])
 
+        seeds = np.random.SeedSequence().spawn(iter_nb)
+
         with (path / method["filename"]).open(mode="w", encoding="utf-8") as fileout:
             fileout.write(print_header(ids_vary))
 
             try:
-                for _ in track(range(iter_nb), total=iter_nb, description="   "):
-                    exp_stat = generate_exp_for_statistics(experiments, statistic_name)
-                    params_lf = database.build_lmfit_params(exp_stat.param_ids)
-                    params_fit = minimize(exp_stat, params_lf, fitmethod)
-                    stats = calculate_statistics(exp_stat, params_fit)
-                    chisqr = stats.get("chisqr", 1e32)
-                    fileout.write(print_values_stat(params_fit, ids_vary, chisqr))
+                if _FORK_CONTEXT is None:
+                    _initialize_statistics_worker(
+                        experiments, statistic_name, fitmethod, ids_vary
+                    )
+                    for seed in track(seeds, total=iter_nb, description="   "):
+                        fileout.write(_run_statistics_iteration(seed))
+                else:
+                    # Iterations are independent and are dispatched to a
+                    # process pool
+                    with ProcessPoolExecutor(
+                        max_workers=max_workers,
+                        mp_context=_FORK_CONTEXT,
+                        initializer=_initialize_statistics_worker,
+                        initargs=(experiments, statistic_name, fitmethod, ids_vary),
+                    ) as executor:
+                        futures = [
+                            executor.submit(_run_statistics_iteration, seed)
+                            for seed in seeds
+                        ]
+                        try:
+                            for future in track(
+                                futures, total=iter_nb, description="   "
+                            ):
+                                fileout.write(future.result())
+                        finally:
+                            for future in futures:
+                                future.cancel()
             except KeyboardInterrupt:
                 print_calculation_stopped_error()
             except ValueError:
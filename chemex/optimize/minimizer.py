@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-from copy import deepcopy
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 import lmfit
 import numpy as np
@@ -17,11 +16,45 @@ from chemex.messages import (
 from chemex.optimize.grouping import ParamTree, create_group_tree
 from chemex.typing import ArrayFloat
 
+# Method-specific keyword tables, built once at import instead of on every
+# minimization call
+_METHOD_KWS = {
+    "brute": {"keep": "all"},
+}
+
+_METHOD_KWS_REPORT = {
+    "brute": {"keep": "all"},
+    "differential_evolution": {"disp": True},
+    "basinhopping": {
+        "disp": True,
+        "niter_success": 10,
+        "minimizer_kwargs": {"method": "L-BFGS-B"},
+    },
+    "ampgo": {"disp": True},
+}
+
+_METHOD_KWS_HIERARCHICAL = {
+    "brute": {"keep": "all"},
+    "ampgo": {"disp": True},
+}
+
 
 @dataclass
 class Reporter:
     last_chisqr: float = +1.0e32
     threshold: float = -1.0e-3
+    _params_id: int = field(default=-1, init=False, repr=False)
+    _nvarys: int = field(default=0, init=False, repr=False)
+
+    def _get_nvarys(self, params: lmfit.Parameters) -> int:
+        # The number of varying parameters is fixed within a fit, so it is
+        # recounted only when a different Parameters object comes in
+        if id(params) != self._params_id:
+            self._nvarys = sum(
+                1 for param in params.values() if param.vary and not param.expr
+            )
+            self._params_id = id(params)
+        return self._nvarys
 
     def iter_cb(
         self,
@@ -31,7 +64,8 @@ class Reporter:
         *_args,
         **_kwargs,
     ) -> None:
-        chisqr = (residuals**2).sum()
+        # Square-and-sum in one pass, without the temporary squared array
+        chisqr = float(np.dot(residuals, residuals))
         change = (chisqr - self.last_chisqr) / self.last_chisqr
 
         if change > self.threshold or iteration < 0:
@@ -40,9 +74,7 @@ class Reporter:
         self.last_chisqr = chisqr
 
         ndata = len(residuals)
-        nvarys = len(
-            [param for param in params.values() if param.vary and not param.expr],
-        )
+        nvarys = self._get_nvarys(params)
         redchi = chisqr / max(1, ndata - nvarys)
 
         self.print_line(iteration, chisqr, redchi)
@@ -57,18 +89,33 @@ class Reporter:
         print_chi2_table_footer(iteration, chisqr, redchi)
 
 
+def _run_with_report(
+    minimizer: lmfit.Minimizer,
+    reporter: Reporter,
+    fitmethod: str,
+    kws: dict[str, dict[str, object]],
+) -> lmfit.Parameters:
+    reporter.print_header()
+
+    try:
+        result = minimizer.minimize(method=fitmethod, **(kws.get(fitmethod, {})))
+        reporter.print_footer(result.nfev, result.chisqr, result.redchi)
+    except KeyboardInterrupt:
+        print_calculation_stopped_error()
+    except ValueError:
+        print_value_error()
+
+    return minimizer.result.params.copy()
+
+
 def minimize(
     experiments: Experiments,
     params: lmfit.Parameters,
     fitmethod: str,
 ) -> lmfit.Parameters:
-    kws = {
-        "brute": {"keep": "all"},
-    }
-
     minimizer = lmfit.Minimizer(experiments.residuals, params)
-    minimizer.minimize(method=fitmethod, **(kws.get(fitmethod, {})))
-    return deepcopy(minimizer.result.params)
+    minimizer.minimize(method=fitmethod, **(_METHOD_KWS.get(fitmethod, {})))
+    return minimizer.result.params.copy()
 
 
 def minimize_with_report(
@@ -76,32 +123,9 @@ def minimize_with_report(
     params: lmfit.Parameters,
     fitmethod: str,
 ) -> lmfit.Parameters:
-    kws = {
-        "brute": {"keep": "all"},
-        "differential_evolution": {"disp": True},
-        "basinhopping": {
-            "disp": True,
-            "niter_success": 10,
-            "minimizer_kwargs": {"method": "L-BFGS-B"},
-        },
-        "ampgo": {"disp": True},
-    }
-
     reporter = Reporter()
-
     minimizer = lmfit.Minimizer(experiments.residuals, params, iter_cb=reporter.iter_cb)
-
-    reporter.print_header()
-
-    try:
-        result = minimizer.minimize(method=fitmethod, **(kws.get(fitmethod, {})))
-        reporter.print_footer(result.nfev, result.chisqr, result.redchi)
-    except KeyboardInterrupt:
-        print_calculation_stopped_error()
-    except ValueError:
-        print_value_error()
-
-    return deepcopy(minimizer.result.params)
+    return _run_with_report(minimizer, reporter, fitmethod, _METHOD_KWS_REPORT)
 
 
 def residuals_hierarchical(
@@ -135,11 +159,6 @@ def residuals_hierarchical(
 def minimize_hierarchical(
     experiments: Experiments, params: lmfit.Parameters, fitmethod: str
 ):
-    kws = {
-        "brute": {"keep": "all"},
-        "ampgo": {"disp": True},
-    }
-
     reporter = Reporter()
 
     param_tree = create_group_tree(experiments)
@@ -156,14 +175,4 @@ def minimize_hierarchical(
         iter_cb=reporter.iter_cb,
     )
 
-    reporter.print_header()
-
-    try:
-        result = minimizer.minimize(method=fitmethod, **(kws.get(fitmethod, {})))
-        reporter.print_footer(result.nfev, result.chisqr, result.redchi)
-    except KeyboardInterrupt:
-        print_calculation_stopped_error()
-    except ValueError:
-        print_value_error()
-
-    return deepcopy(minimizer.result.params)
+    return _run_with_report(minimizer, reporter, fitmethod, _METHOD_KWS_HIERARCHICAL)
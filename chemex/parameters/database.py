@@ -128,13 +128,16 @@ class ParameterCatalog:
         Args:
             parameter (ParamSetting): The parameter to be added.
         """
-        if parameter.id_ not in self._parameters:
-            self._parameters[parameter.id_] = parameter
+        param_id = parameter.id_
+        existing = self._parameters.get(param_id)
+        if existing is None:
+            existing = parameter
+            self._parameters[param_id] = parameter
             self._index.add(parameter.param_name)
 
         if parameter.vary:
-            self._parameters[parameter.id_].vary = True
-            self._parameters[parameter.id_].expr = ""
+            existing.vary = True
+            existing.expr = ""
 
     def add_multiple(self, parameters: Parameters) -> None:
         """Adds multiple parameters to the catalog.
@@ -58,18 +58,18 @@ def _build_parameters(
         local_name: param_name.id_ for local_name, param_name in param_names.items()
     }
 
+    # Most settings carry no expression at all, so formatting is only done
+    # when there is actually a placeholder to substitute
     parameters: Parameters = {}
     for local_name, setting in settings.items():
-        param_id = name_map[local_name]
-        param_name = param_names[local_name]
-        expression = setting.expr.format_map(name_map)
-        parameters[param_id] = ParamSetting(
-            param_name=param_name,
+        expr = setting.expr
+        parameters[name_map[local_name]] = ParamSetting(
+            param_name=param_names[local_name],
             value=setting.value,
             min=setting.min,
             max=setting.max,
             vary=setting.vary,
-            expr=expression,
+            expr=expr.format_map(name_map) if "{" in expr else expr,
         )
 
     return name_map, parameters
@@ -11,6 +11,7 @@ from rapidfuzz.process import extractOne
 
 from chemex.configuration.conditions import Conditions
 from chemex.parameters.spin_system import SpinSystem
+from chemex.parameters.spin_system.utilities import normalize_name
 
 _EXPAND = {"-": "_", "+": "_", ".": "_"}
 
@@ -72,7 +73,7 @@ class ParamName:
     search_keys: set[Hashable] = field(init=False, compare=False)
 
     def __post_init__(self) -> None:
-        self.name = self.name.strip().upper()
+        self.name = normalize_name(self.name)
         self.conditions = self.conditions.rounded()
         self.search_keys = (
             self.spin_system.search_keys | self.conditions.search_keys | {self.name}
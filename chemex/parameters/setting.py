@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass, field
+from functools import cache
 from re import Pattern
 from typing import Literal
 
@@ -16,6 +17,21 @@ _RE_IDS = re.compile(r"__[a-zA-Z_][a-zA-Z0-9_]*")
 _RE_NAMES = re.compile(r"\{([a-zA-Z0-9_]+)\}")
 
 
+@cache
+def _find_dependencies(
+    re_dependencies: Pattern[str],
+    expression: str,
+) -> frozenset[str]:
+    """Extract the dependency names of an expression, memoized.
+
+    Most expressions are empty and the non-empty ones come from a small set
+    of formula templates shared by many parameters.
+    """
+    if not expression:
+        return frozenset()
+    return frozenset(re_dependencies.findall(expression))
+
+
 @dataclass(frozen=True)
 class NameSetting:
     name: str
@@ -36,7 +52,7 @@ class ExpressionSetting:
     def __init__(self, re_dependencies: Pattern[str]) -> None:
         self.re_dependencies = re_dependencies
         self.__expr: str = ""
-        self.__dependencies: set[str] = set()
+        self.__dependencies: frozenset[str] = frozenset()
 
     @property
     def expr(self) -> str:
@@ -45,10 +61,10 @@ class ExpressionSetting:
     @expr.setter
     def expr(self, expression: str) -> None:
         self.__expr = expression
-        self.__dependencies = set(self.re_dependencies.findall(expression))
+        self.__dependencies = _find_dependencies(self.re_dependencies, expression)
 
     @property
-    def dependencies(self) -> set[str]:
+    def dependencies(self) -> frozenset[str]:
         return self.__dependencies
 
     def __str__(self) -> str:
@@ -82,7 +98,7 @@ class ParamLocalSetting:
         self.__expr.expr = value
 
     @property
-    def dependencies(self) -> set[str]:
+    def dependencies(self) -> frozenset[str]:
         return self.__expr.dependencies
 
 
@@ -117,7 +133,7 @@ class ParamSetting:
         self.__expr.expr = value
 
     @property
-    def dependencies(self) -> set[str]:
+    def dependencies(self) -> frozenset[str]:
         return self.__expr.dependencies
 
     @property
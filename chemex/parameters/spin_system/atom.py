@@ -5,13 +5,16 @@ from __future__ import annotations
 from collections.abc import Hashable
 from copy import deepcopy
 from dataclasses import dataclass, field
+from functools import cache
+from sys import intern
 from typing import Self
 
 from .constants import CORRECT_ATOM_NAME
 from .nucleus import Nucleus, str2nucleus
+from .utilities import normalize_name
 
 
-@dataclass(order=True)
+@dataclass(order=True, slots=True)
 class Atom:
     """Represents an atom in a molecular structure.
 
@@ -22,20 +25,21 @@ class Atom:
         name (str): The name of the atom.
         nucleus (Nucleus): The type of nucleus associated with the atom, determined
                            automatically.
-        search_keys (set[Hashable]): Set of keys used for searching or matching the
-                                     atom.
+        search_keys (frozenset[Hashable]): Set of keys used for searching or matching
+                                           the atom.
     """
 
     name: str
     nucleus: Nucleus = field(init=False, compare=False)
-    search_keys: set[Hashable] = field(init=False, default_factory=set, compare=False)
+    search_keys: frozenset[Hashable] = field(init=False, compare=False)
 
     def __post_init__(self) -> None:
         """Initializes the Atom instance, correcting the atom name and determining the nucleus type."""
-        name = self.name.strip().upper()
-        self.name = CORRECT_ATOM_NAME.get(name, name)
+        name = normalize_name(self.name)
+        # Interned names make the equality and hash fast paths pointer-based
+        self.name = intern(CORRECT_ATOM_NAME.get(name, name))
         self.nucleus = str2nucleus(self.name[:1])
-        self.search_keys.update({self, self.nucleus})
+        self.search_keys = frozenset((self, self.nucleus))
 
     def match(self, other: Atom) -> bool:
         """Checks if this atom matches another atom based on the name.
@@ -92,16 +96,29 @@ class Atom:
         new_atom.name = deepcopy(self.name, memo)
         new_atom.nucleus = deepcopy(self.nucleus, memo)
 
-        # Copy search_keys excluding self
+        # Copy search_keys, replacing self with the new instance
         new_search_keys = deepcopy(
             {key for key in self.search_keys if key is not self}, memo
         )
-        new_atom.search_keys = new_search_keys
-
-        # Add the new_atom to its own search_keys set
-        new_atom.search_keys.add(new_atom)
+        new_atom.search_keys = frozenset(new_search_keys) | {new_atom}
 
         # Memoize the new instance
         memo[id(self)] = new_atom
 
         return new_atom
+
+
+@cache
+def make_atom(name: str) -> Atom:
+    """Returns a shared Atom instance for the given name.
+
+    Atoms are value objects that are never mutated after construction, so
+    repeated names can reuse the same instance and skip the parsing work.
+
+    Args:
+        name (str): The name of the atom.
+
+    Returns:
+        Atom: The shared Atom instance.
+    """
+    return Atom(name)
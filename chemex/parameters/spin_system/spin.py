@@ -1,34 +1,47 @@
 from __future__ import annotations
 
-from functools import total_ordering
-from re import search
+from functools import cache
 
-from chemex.parameters.spin_system.atom import Atom
+from chemex.parameters.spin_system.atom import Atom, make_atom
 from chemex.parameters.spin_system.constants import STANDARD_ATOM_NAMES
-from chemex.parameters.spin_system.group import Group
+from chemex.parameters.spin_system.group import Group, make_group
+from chemex.parameters.spin_system.utilities import normalize_name
+
+_ATOM_CHARS = frozenset("HCNQM")
 
 
-@total_ordering
 class Spin:
+    __slots__ = ("group", "atom", "search_keys", "_cmp_key", "_hash")
+
     def __init__(self, name: str, group_for_completion: Group | None = None) -> None:
-        self.group, self.atom = self.split_group_atom(name.strip().upper())
+        self.group, self.atom = self.split_group_atom(normalize_name(name))
         if not self.group and group_for_completion:
             self.group = group_for_completion
         self.search_keys = self.group.search_keys | self.atom.search_keys
+        self._cmp_key = (self.atom.nucleus.name, self.group, self.atom)
+        self._hash = hash(self.name)
 
     @staticmethod
     def split_group_atom(name: str) -> tuple[Group, Atom]:
         if name == "?":
-            return Group(""), Atom("")
-        found_digit = search("[0-9]", name)
-        first_digit = found_digit.start() if found_digit else 0
-        found_atom = search("[HCNQM]", name[first_digit:])
-        if not found_atom:
+            return make_group(""), make_atom("")
+        first_digit = next(
+            (index for index, character in enumerate(name) if character.isdigit()),
+            0,
+        )
+        atom_index = next(
+            (
+                index
+                for index in range(first_digit, len(name))
+                if name[index] in _ATOM_CHARS
+            ),
+            -1,
+        )
+        if atom_index < 0:
             if name in STANDARD_ATOM_NAMES:
-                return Group(""), Atom(name)
-            return Group(name), Atom("")
-        atom_index = first_digit + found_atom.start()
-        return Group(name[:atom_index]), Atom(name[atom_index:])
+                return make_group(""), make_atom(name)
+            return make_group(name), make_atom("")
+        return make_group(name[:atom_index]), make_atom(name[atom_index:])
 
     @property
     def name(self) -> str:
@@ -40,9 +53,25 @@ class Spin:
     def __lt__(self, other: object) -> bool:
         if not isinstance(other, type(self)):
             return NotImplemented
-        self_tuple = (self.atom.nucleus.name, self.group, self.atom)
-        other_tuple = (other.atom.nucleus.name, other.group, other.atom)
-        return self_tuple < other_tuple
+        return self._cmp_key < other._cmp_key
+
+    # The remaining orderings are written out instead of synthesized with
+    # functools.total_ordering, removing one layer of dispatch per comparison
+
+    def __le__(self, other: object) -> bool:
+        if not isinstance(other, type(self)):
+            return NotImplemented
+        return self._cmp_key < other._cmp_key or self.name == other.name
+
+    def __gt__(self, other: object) -> bool:
+        if not isinstance(other, type(self)):
+            return NotImplemented
+        return not (self._cmp_key < other._cmp_key or self.name == other.name)
+
+    def __ge__(self, other: object) -> bool:
+        if not isinstance(other, type(self)):
+            return NotImplemented
+        return not self._cmp_key < other._cmp_key
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, type(self)):
@@ -50,7 +79,7 @@ class Spin:
         return self.name == other.name
 
     def __hash__(self) -> int:
-        return hash(self.name)
+        return self._hash
 
     def __bool__(self) -> bool:
         return bool(self.name)
@@ -60,3 +89,21 @@ class Spin:
 
     def __str__(self) -> str:
         return self.name
+
+
+@cache
+def make_spin(name: str, group_for_completion: Group | None = None) -> Spin:
+    """Returns a shared Spin instance for the given name.
+
+    Spins are value objects that are never mutated after construction, so
+    repeated names can reuse the same instance and skip the parsing work.
+
+    Args:
+        name (str): The name of the spin.
+        group_for_completion (Group | None): Group used when the name carries
+                                             no group of its own.
+
+    Returns:
+        Spin: The shared Spin instance.
+    """
+    return Spin(name, group_for_completion)
@@ -1,22 +1,30 @@
 from __future__ import annotations
 
 from collections.abc import Hashable, Iterable, Sequence
-from functools import cache, cached_property, total_ordering
+from functools import cache, cached_property
+from sys import intern
 from typing import TYPE_CHECKING, Any, Literal, Self
 
 from pydantic import BaseModel, Field, InstanceOf, computed_field, model_validator
 
 from chemex.parameters.spin_system.atom import Atom
-from chemex.parameters.spin_system.group import Group
+from chemex.parameters.spin_system.group import NO_NUMBER, Group
 from chemex.parameters.spin_system.nucleus import Nucleus
-from chemex.parameters.spin_system.spin import Spin
-from chemex.parameters.spin_system.utilities import powerset
+from chemex.parameters.spin_system.spin import Spin, make_spin
+from chemex.parameters.spin_system.utilities import normalize_name, powerset
 
 if TYPE_CHECKING:
     from chemex.nmr.basis import Basis
 
 SPIN_ALIASES = "isx"
 
+# The alias subsets never change, so the powerset and the derived keys are
+# computed once instead of per SpinSystem
+_ALIAS_POWERSET = tuple(
+    (frozenset(alias_set), "".join(alias_set), alias_set)
+    for alias_set in powerset(SPIN_ALIASES)
+)
+
 
 @cache
 def _parse_spin_system(name: str) -> dict[str, Spin]:
@@ -26,23 +34,66 @@ def _parse_spin_system(name: str) -> dict[str, Spin]:
     spins: dict[str, Spin] = {}
     last_group = None
     for short_name, name_spin in zip(SPIN_ALIASES, split, strict=False):
-        spin = Spin(name_spin, last_group)
+        spin = make_spin(name_spin, last_group)
         spins[short_name] = spin
         last_group = spin.group
     return spins
 
 
 def _spins2name(spins: Iterable[Spin]) -> str:
-    spin_names: list[str] = []
-    last_group: Group = Group("")
-    for spin in spins:
-        spin_name = str(spin.atom) if spin.group == last_group else str(spin)
-        spin_names.append(spin_name)
-        last_group = spin.group
+    spins_iter = iter(spins)
+    first = next(spins_iter, None)
+    if first is None:
+        return ""
+    # The first spin always carries its group; only the followers drop it
+    # when they share the group of their predecessor
+    spin_names: list[str] = [str(first)]
+    last_group = first.group
+    for spin in spins_iter:
+        if spin.group == last_group:
+            spin_names.append(str(spin.atom))
+        else:
+            spin_names.append(str(spin))
+            last_group = spin.group
     return "-".join(spin_names)
 
 
-@total_ordering
+@cache
+def _match(item: SpinSystem, spin_system: SpinSystem) -> bool:
+    """Memoized SpinSystem.match, used when filtering with selections.
+
+    Selections are matched against every profile of every experiment and for
+    every method step, so the same pairs come up over and over.
+    """
+    return item.match(spin_system)
+
+
+@cache
+def _build_selection_index(
+    selection: tuple[SpinSystem, ...],
+) -> tuple[dict[int, tuple[SpinSystem, ...]], tuple[SpinSystem, ...]]:
+    """Indexes a selection by the residue number of its items' first group.
+
+    An item whose first group carries a number can only match spin systems
+    whose first group carries the same number, so those items only need to be
+    tried against the matching bucket. Items without a number (or without any
+    spin) can match anything and go into a fallback bucket that is always
+    scanned.
+    """
+    by_number: dict[int, list[SpinSystem]] = {}
+    wildcards: list[SpinSystem] = []
+    for item in selection:
+        first_spin = next(iter(item.spins.values()), None)
+        if first_spin is None or first_spin.group.number == NO_NUMBER:
+            wildcards.append(item)
+        else:
+            by_number.setdefault(first_spin.group.number, []).append(item)
+    return (
+        {number: tuple(items) for number, items in by_number.items()},
+        tuple(wildcards),
+    )
+
+
 class SpinSystem(BaseModel):
     name: str = ""
     spins: dict[str, InstanceOf[Spin]] = Field(default_factory=dict)
@@ -51,9 +102,11 @@ class SpinSystem(BaseModel):
     @classmethod
     def parse_name(cls, model: Any) -> Any:
         if isinstance(model, dict) and "name" in model:
-            name = str(model["name"]).strip().upper()
+            name = normalize_name(str(model["name"]))
             model["spins"] = _parse_spin_system(name)
-            model["name"] = _spins2name(model["spins"].values())
+            # Interned names make the equality and hash fast paths
+            # pointer-based
+            model["name"] = intern(_spins2name(model["spins"].values()))
         return model
 
     @classmethod
@@ -64,39 +117,80 @@ class SpinSystem(BaseModel):
 
     @computed_field
     @cached_property
-    def search_keys(self) -> set[Hashable]:
-        search_keys: set[Hashable] = set()
+    def search_keys(self) -> frozenset[Hashable]:
+        search_keys: frozenset[Hashable] = frozenset()
         return search_keys.union(*(spin.search_keys for spin in self.spins.values()))
 
     @cached_property
     def names(self) -> dict[str, str]:
         result: dict[str, str] = {}
-        for alias_set in powerset(SPIN_ALIASES):
-            if set(alias_set).issubset(self.spins):
-                key = "".join(alias_set)
-                name = _spins2name(self.spins[alias] for alias in alias_set)
-                result[key] = name
+        for aliases, key, alias_set in _ALIAS_POWERSET:
+            if aliases.issubset(self.spins):
+                result[key] = _spins2name(self.spins[alias] for alias in alias_set)
         return result
 
     @cached_property
+    def _attribute_maps(
+        self,
+    ) -> tuple[
+        dict[str, Group],
+        dict[str, str],
+        dict[str, int],
+        dict[str, Atom],
+        dict[str, Nucleus],
+    ]:
+        # The five maps are derived from the spins in a single pass instead
+        # of one iteration per map
+        groups: dict[str, Group] = {}
+        symbols: dict[str, str] = {}
+        numbers: dict[str, int] = {}
+        atoms: dict[str, Atom] = {}
+        nuclei: dict[str, Nucleus] = {}
+        for alias, spin in self.spins.items():
+            group = spin.group
+            atom = spin.atom
+            groups[alias] = group
+            symbols[alias] = group.symbol
+            numbers[alias] = group.number
+            atoms[alias] = atom
+            nuclei[alias] = atom.nucleus
+        return groups, symbols, numbers, atoms, nuclei
+
+    @property
     def groups(self) -> dict[str, Group]:
-        return {alias: spin.group for alias, spin in self.spins.items()}
+        return self._attribute_maps[0]
 
-    @cached_property
+    @property
     def symbols(self) -> dict[str, str]:
-        return {alias: group.symbol for alias, group in self.groups.items()}
+        return self._attribute_maps[1]
 
-    @cached_property
+    @property
     def numbers(self) -> dict[str, int]:
-        return {alias: group.number for alias, group in self.groups.items()}
+        return self._attribute_maps[2]
 
-    @cached_property
+    @property
     def atoms(self) -> dict[str, Atom]:
-        return {alias: spin.atom for alias, spin in self.spins.items()}
+        return self._attribute_maps[3]
 
-    @cached_property
+    @property
     def nuclei(self) -> dict[str, Nucleus]:
-        return {alias: atom.nucleus for alias, atom in self.atoms.items()}
+        return self._attribute_maps[4]
+
+    @cached_property
+    def _spin_set(self) -> frozenset[Spin]:
+        return frozenset(self.spins.values())
+
+    @cached_property
+    def _group_set(self) -> frozenset[Group]:
+        return frozenset(self.groups.values())
+
+    @cached_property
+    def _cmp_key(self) -> tuple[Spin, ...]:
+        return tuple(self.spins.values())
+
+    @cached_property
+    def _hash(self) -> int:
+        return hash(self.name)
 
     def match(self, other: Self) -> bool:
         spin_pairs = zip(self.spins.values(), other.spins.values(), strict=False)
@@ -105,18 +199,18 @@ class SpinSystem(BaseModel):
     def part_of(self, selection: Sequence[Self] | str) -> bool:
         if isinstance(selection, str):
             return selection.lower() in ("all", "*")
-        return any(item.match(self) for item in selection)
+        first_spin = next(iter(self.spins.values()), None)
+        if first_spin is None:
+            # A spin system without spins matches every selection item
+            return bool(selection)
+        by_number, wildcards = _build_selection_index(tuple(selection))
+        candidates = by_number.get(first_spin.group.number, ())
+        return any(_match(item, self) for item in candidates) or any(
+            _match(item, self) for item in wildcards
+        )
 
     def correct(self, basis: Basis) -> Self:
-        spins: list[Spin] = []
-        last_spin = Spin("")
-        for letter, atom in basis.atoms.items():
-            spin = Spin(self.spins.get(letter, last_spin).name)
-            if not spin.atom.name.startswith(atom.upper()):
-                spin.atom = Atom(f"{atom}{spin.atom.name[1:]}")
-            last_spin = spin
-            spins.append(spin)
-        return type(self)(name=_spins2name(spins))
+        return _correct(self, basis)
 
     def build_sub_spin_system(
         self,
@@ -137,9 +231,15 @@ class SpinSystem(BaseModel):
             return NotImplemented
         if self == other:
             return type(self)(name=self.name)
-        if spins := set(self.spins.values()) & set(other.spins.values()):
+        if len(self._spin_set) == 1 == len(other._spin_set):
+            # Common single-spin case: a membership test replaces the
+            # set intersections
+            (spin,) = self._spin_set
+            if spin in other._spin_set:
+                return type(self)(name=spin.name)
+        elif spins := self._spin_set & other._spin_set:
             return type(self)(name="-".join(spin.name for spin in spins))
-        groups = set(self.groups.values()) & set(other.groups.values())
+        groups = self._group_set & other._group_set
         if len(groups) == 1:
             return type(self)(name="-".join(group.name for group in groups))
         return type(self)()
@@ -147,7 +247,29 @@ class SpinSystem(BaseModel):
     def __lt__(self, other: object) -> bool:
         if not isinstance(other, type(self)):
             return NotImplemented
-        return tuple(self.spins.values()) < tuple(other.spins.values())
+        return self._cmp_key < other._cmp_key
+
+    # The remaining orderings are written out instead of synthesized with
+    # functools.total_ordering, removing one layer of dispatch per comparison
+
+    def __le__(self, other: object) -> bool:
+        if not isinstance(other, type(self)):
+            return NotImplemented
+        if self.name == other.name:
+            return True
+        return self._cmp_key < other._cmp_key
+
+    def __gt__(self, other: object) -> bool:
+        if not isinstance(other, type(self)):
+            return NotImplemented
+        if self.name == other.name:
+            return False
+        return not self._cmp_key < other._cmp_key
+
+    def __ge__(self, other: object) -> bool:
+        if not isinstance(other, type(self)):
+            return NotImplemented
+        return not self._cmp_key < other._cmp_key
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, type(self)):
@@ -155,7 +277,7 @@ class SpinSystem(BaseModel):
         return self.name == other.name
 
     def __hash__(self) -> int:
-        return hash(self.name)
+        return self._hash
 
     def __bool__(self) -> bool:
         return bool(self.name)
@@ -164,6 +286,25 @@ class SpinSystem(BaseModel):
         return self.name
 
 
+@cache
+def _correct(spin_system: SpinSystem, basis: Basis) -> SpinSystem:
+    """Corrects a spin system to be consistent with the basis atoms.
+
+    Spin systems and bases are both immutable, and liouvillians are built from
+    the same pairs over and over, so the result is memoized.
+    """
+    spins: list[Spin] = []
+    last_spin = make_spin("")
+    for letter, atom in basis.atoms.items():
+        spin = spin_system.spins.get(letter, last_spin)
+        if not spin.atom.name.startswith(atom.upper()):
+            corrected_atom = f"{atom.upper()}{spin.atom.name[1:]}"
+            spin = make_spin(f"{spin.group}{corrected_atom}")
+        last_spin = spin
+        spins.append(spin)
+    return type(spin_system)(name=_spins2name(spins))
+
+
 # if __name__ == "__main__":
 #     print(
 #         SpinSystem(name="G23N-G23HN"),
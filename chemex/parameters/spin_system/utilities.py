@@ -30,3 +30,21 @@ def powerset(iterable: Iterable[T]) -> Iterable[tuple[T, ...]]:
     """
     s = list(iterable)
     return chain.from_iterable(combinations(s, r) for r in range(1, len(s) + 1))
+
+
+def normalize_name(name: str) -> str:
+    """Strips and upper-cases a spin-system name.
+
+    Names coming from the parsing pipeline are usually normalized already, in
+    which case the input string is returned as is without allocating
+    transformed copies.
+
+    Args:
+        name (str): The name to normalize.
+
+    Returns:
+        str: The stripped, upper-cased name.
+    """
+    if name.isascii() and name.isupper() and name == name.strip():
+        return name
+    return name.strip().upper()
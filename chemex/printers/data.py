@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from io import StringIO
 from typing import Protocol
 
+import numpy as np
+
 from chemex.containers.data import Data
 
 
@@ -43,10 +46,6 @@ class ProfilePrinter:
     simulation: bool = False
 
     def print(self, name: str, data: Data) -> str:
-        output: list[list[str]] = []
-
-        output.append([f"[{name}]"])
-
         header: list[str] = [
             "#",
             f"{self.first_column_name:>12s}",
@@ -56,34 +55,28 @@ class ProfilePrinter:
         ]
         if self.simulation:
             del header[2:4]
-        output.append(header)
-
-        for metadata, exp, err, calc, mask in zip(
-            data.metadata,
-            data.exp,
-            data.err,
-            data.calc,
+            columns = (data.metadata, data.calc)
+            row_fmt = f"%{self.first_column_fmt} % 17.8e"
+        else:
+            columns = (data.metadata, data.exp, data.err, data.calc)
+            row_fmt = f"%{self.first_column_fmt} % 17.8e % 17.8e % 17.8e"
+
+        # All the numbers are formatted in one np.savetxt call, which is much
+        # faster than building every line with Python-level f-strings
+        buffer = StringIO()
+        np.savetxt(buffer, np.column_stack(columns), fmt=row_fmt)
+
+        output = [f"[{name}]", " ".join(header)]
+        for row, mask in zip(
+            buffer.getvalue().splitlines(),
             data.mask,
             strict=True,
         ):
             start = " " if mask else "#"
             end = "" if mask else " # NOT USED IN THE FIT"
-            line: list[str] = []
-            line.extend(
-                [
-                    f"{start}",
-                    f"{metadata:{self.first_column_fmt}}",
-                    f"{exp: 17.8e}",
-                    f"{err: 17.8e}",
-                    f"{calc: 17.8e}",
-                    f"{end}",
-                ]
-            )
-            if self.simulation:
-                del line[2:4]
-            output.append(line)
+            output.append(f"{start} {row} {end}")
 
-        return "\n".join(" ".join(line) for line in output) + "\n\n"
+        return "\n".join(output) + "\n\n"
 
 
 @dataclass
@@ -1,13 +1,12 @@
 """The module provides functions for estimating the noise variance in data."""
 from __future__ import annotations
 
-import contextlib
 from collections import defaultdict
 from collections.abc import Callable
 from typing import Any
 
 import numpy as np
-from scipy import interpolate, signal, stats
+from scipy import signal, stats
 from scipy.linalg import norm
 
 from chemex.containers.data import Data
@@ -77,17 +76,17 @@ def _variance_from_scatter(data: Data) -> float:
     percent_points = stats.norm.ppf(1.0 - percents)
     sigma_est = []
     for fdai in fda:
-        noisedata = sorted(signal.convolve(data.exp, fdai, mode="valid"))
-        ntrim = len(noisedata)
+        noisedata = np.sort(signal.convolve(data.exp, fdai, mode="valid"))
+        ntrim = noisedata.size
         if ntrim <= 1:
             continue
         xaxis = (0.5 + np.arange(1, ntrim + 1)) / (ntrim + 0.5)
-        sigmas: list[float] = []
-        function = interpolate.interp1d(xaxis, noisedata, "linear")
-        for a_perc, a_z in zip(percents, percent_points, strict=True):
-            with contextlib.suppress(ValueError):
-                val = (function(1.0 - a_perc) - function(a_perc)) / (2.0 * a_z)
-                sigmas.append(val)
+        # Interpolate all the percentage points in one vectorized call,
+        # keeping only those lying within the sampled range
+        valid = (percents >= xaxis[0]) & (1.0 - percents <= xaxis[-1])
+        lower = np.interp(percents[valid], xaxis, noisedata)
+        upper = np.interp(1.0 - percents[valid], xaxis, noisedata)
+        sigmas = (upper - lower) / (2.0 * percent_points[valid])
         sigma_est.append(np.median(sigmas))
     variance = np.median(sigma_est) ** 2 / (
         1.0 + 15.0 * (data.exp.size + 1.225) ** -1.245